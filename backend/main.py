@@ -8,13 +8,24 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 import pandas as pd
 import numpy as np
-import json
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 import os
+import functools
+import codecs
+import warnings
 from datetime import datetime
-from typing import Dict, List, Any, Optional, cast
+from typing import Callable, Dict, List, Any, Optional, Tuple, cast
 import logging
 from pathlib import Path
 
+# Copy-on-Write is always enabled from pandas 3.0; opt in on 2.x so frames
+# derived from the cached raw data never need defensive copies
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -37,6 +48,271 @@ app.add_middleware(
 )
 
 
+# Points shown by bar charts and slices shown by pie charts
+BAR_CHART_MAX_POINTS = 10
+PIE_CHART_MAX_SLICES = 8
+
+# Longest series any chart type renders (line, area and scatter use all)
+CHART_MAX_POINTS = 20
+
+# Distinct filter specs whose compiled predicates are kept for reuse
+COMPILED_FILTERS_MAX = 32
+
+# Chart types included in ETL results and dashboard responses
+DASHBOARD_CHART_TYPES = ["line", "bar", "area", "pie"]
+
+# CSVs above this size are parsed straight from a memory map
+MEMORY_MAP_THRESHOLD = 64 << 20
+
+
+# Text columns with fewer distinct values than this share of rows become
+# pandas categoricals (integer codes instead of one Python str per cell)
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def _categorize_low_cardinality(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert repetitive text columns to the ``category`` dtype"""
+    if len(df) == 0:
+        return df
+
+    categorical = {}
+    for col in df.select_dtypes(include=["object", "string"]).columns:
+        if df[col].nunique(dropna=False) / len(df) < CATEGORY_MAX_UNIQUE_RATIO:
+            categorical[col] = df[col].astype("category")
+
+    return df.assign(**categorical) if categorical else df
+
+
+# Encodings tried for CSV input, in order of preference
+CSV_ENCODINGS = ["utf-8", "latin-1", "cp1252", "iso-8859-1"]
+
+# Bytes read from the start of a CSV to pick its encoding
+ENCODING_SNIFF_BYTES = 64 * 1024
+
+
+def _sniff_encoding(file_path: str) -> str:
+    """Return the first supported encoding that decodes the head of the file"""
+    with open(file_path, "rb") as f:
+        sample = f.read(ENCODING_SNIFF_BYTES)
+
+    for encoding in CSV_ENCODINGS:
+        try:
+            # final=False tolerates a multi-byte character cut at the boundary
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+
+    return CSV_ENCODINGS[0]
+
+
+# Cell values pandas' C parser reads as missing by default
+CSV_NA_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+
+def _read_csv_pyarrow(
+    file_path: str, encoding: str, memory_map: bool
+) -> Optional[pd.DataFrame]:
+    """Parse a CSV with Arrow's multi-threaded reader.
+
+    Values come back as the pandas C parser would produce them: the same
+    missing-value markers apply, blank headers become ``Unnamed: {i}``,
+    all-missing columns are float64 and date-like text stays text. Returns
+    None for inputs the C parser handles differently (duplicate headers,
+    integers beyond the int64 range).
+    """
+    read_options = pa_csv.ReadOptions(encoding=encoding)
+    convert_options = pa_csv.ConvertOptions(
+        null_values=CSV_NA_VALUES, strings_can_be_null=True
+    )
+    source = pa.memory_map(file_path) if memory_map else file_path
+    table = pa_csv.read_csv(
+        source, read_options=read_options, convert_options=convert_options
+    )
+
+    names = [name or f"Unnamed: {i}" for i, name in enumerate(table.column_names)]
+    if len(set(names)) != len(names):
+        return None
+
+    # Arrow reads integers that overflow int64 as doubles, where the C
+    # parser keeps uint64; doubles this large are always whole numbers
+    for field in table.schema:
+        if pa.types.is_floating(field.type):
+            largest = pc.max(pc.abs(table.column(field.name))).as_py()
+            if largest is not None and largest >= 2**63:
+                return None
+
+    # Arrow infers dates and times that the C parser leaves as strings.
+    # ISO dates cast back to identical text; anything else is re-read raw.
+    temporal = [f for f in table.schema if pa.types.is_temporal(f.type)]
+    if any(not pa.types.is_date32(f.type) for f in temporal):
+        convert_options.column_types = {f.name: pa.string() for f in temporal}
+        source = pa.memory_map(file_path) if memory_map else file_path
+        table = pa_csv.read_csv(
+            source, read_options=read_options, convert_options=convert_options
+        )
+
+    for i, field in enumerate(table.schema):
+        if pa.types.is_date32(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+        elif pa.types.is_null(field.type):
+            # Columns with no values at all are float64 NaN in pandas
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+
+    return table.rename_columns(names).to_pandas()
+
+
+def _read_csv(
+    file_path: str, encoding: str, memory_map: bool
+) -> Tuple[pd.DataFrame, str]:
+    """Parse a CSV, preferring pyarrow and falling back to the C parser"""
+    try:
+        df = _read_csv_pyarrow(file_path, encoding, memory_map)
+        if df is not None:
+            return df, "pyarrow"
+    except pa.ArrowException as e:
+        logger.info(f"pyarrow could not parse {file_path} ({e}); using C parser")
+
+    df = pd.read_csv(file_path, encoding=encoding, memory_map=memory_map)
+    return df, "c"
+
+
+def _downcast_integers(
+    df: pd.DataFrame,
+) -> Tuple[pd.DataFrame, Dict[str, Dict[str, str]]]:
+    """Shrink integer columns to the narrowest dtype that holds their values.
+
+    Floats are left at float64: float32 would change the values written to
+    JSON and CSV output. Returns the frame and the dtype changes made.
+    """
+    downcast = {}
+    changes = {}
+    for col in df.select_dtypes(include=["integer"]).columns:
+        narrowed = pd.to_numeric(df[col], downcast="integer")
+        if narrowed.dtype != df[col].dtype:
+            downcast[col] = narrowed
+            changes[col] = {
+                "original": str(df[col].dtype),
+                "downcast": str(narrowed.dtype),
+            }
+
+    return (df.assign(**downcast) if downcast else df), changes
+
+
+def _read_csv_file(file_path: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Read a CSV file, trying each supported encoding in turn.
+
+    Returns the frame and details of how it was read (parser used, integer
+    downcasts).
+    """
+    memory_map = os.path.getsize(file_path) > MEMORY_MAP_THRESHOLD
+
+    # Encodings that already failed on the sniffed head would fail on the
+    # full file too, so the parse starts at the first one that decoded it
+    sniffed = _sniff_encoding(file_path)
+    encodings = CSV_ENCODINGS[CSV_ENCODINGS.index(sniffed) :]
+
+    for encoding in encodings:
+        try:
+            df, parser = _read_csv(file_path, encoding, memory_map)
+            logger.info(f"Successfully loaded with {encoding} encoding")
+            df, dtypes = _downcast_integers(_categorize_low_cardinality(df))
+            return df, {"parser": parser, "dtypes": dtypes}
+        except UnicodeDecodeError:
+            continue
+
+    raise ValueError("Could not decode CSV file with any supported encoding")
+
+
+# Only CSVs up to this size are kept parsed in memory between runs
+CSV_CACHE_MAX_BYTES = 8 << 20
+
+
+@functools.lru_cache(maxsize=8)
+def _read_csv_cached(
+    file_path: str, mtime: float
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Memoized :func:`_read_csv_file`.
+
+    ``mtime`` is only part of the cache key: editing the file on disk
+    invalidates the cached frame. Callers must not mutate the result.
+    """
+    return _read_csv_file(file_path)
+
+
+def _parquet_safe(df: pd.DataFrame) -> pd.DataFrame:
+    """Stringify object columns that mix value types.
+
+    Arrow needs one type per column, but cleaning can leave e.g. booleans
+    beside the "Unknown" fill value; such columns are written as text.
+    """
+    mixed = {
+        col: df[col].astype(str)
+        for col in df.columns
+        if df[col].dtype == object
+        and pd.api.types.infer_dtype(df[col], skipna=True).startswith("mixed")
+    }
+    return df.assign(**mixed) if mixed else df
+
+
+def _comparable(values: pd.Series) -> pd.Series:
+    """Expose categorical values for range checks"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Unordered categoricals only support equality checks
+        return values.astype(values.cat.categories.dtype)
+    return values
+
+
+def _compile_condition(condition: Any) -> Optional[Callable[[pd.Series], pd.Series]]:
+    """Build the row predicate for one filter condition.
+
+    Dicts give inclusive ``min``/``max`` ranges, lists give membership and any
+    other value an equality check. Returns None for a condition that filters
+    nothing (a dict without either bound).
+    """
+    if isinstance(condition, dict):
+        low, high = condition.get("min"), condition.get("max")
+        if "min" in condition and "max" in condition:
+
+            def in_range(values: pd.Series) -> pd.Series:
+                values = _comparable(values)
+                return (values >= low) & (values <= high)
+
+            return in_range
+        if "min" in condition:
+            return lambda values: _comparable(values) >= low
+        if "max" in condition:
+            return lambda values: _comparable(values) <= high
+        return None
+
+    if isinstance(condition, list):
+        # Copy so later edits to the caller's list cannot alter a cached spec
+        members = list(condition)
+        return lambda values: values.isin(members)
+
+    return lambda values: values == condition
+
+
 # Global ETL processor instance
 class ETLProcessor:
     def __init__(self, data_dir: str = "data", output_dir: str = "reports"):
@@ -45,12 +321,24 @@ class ETLProcessor:
         self.raw_data = None
         self.filtered_data = None
         self.etl_metadata: Dict[str, Any] = {}
+        self._prepared_series_cache: Optional[Dict[str, Any]] = None
+        self._compiled_filters: Dict[str, List[Tuple[str, Any]]] = {}
 
         # Create output directories
         os.makedirs(output_dir, exist_ok=True)
         os.makedirs(f"{output_dir}/charts", exist_ok=True)
         os.makedirs(f"{output_dir}/data", exist_ok=True)
 
+    @property
+    def filtered_data(self) -> Optional[pd.DataFrame]:
+        return self._filtered_data
+
+    @filtered_data.setter
+    def filtered_data(self, df: Optional[pd.DataFrame]) -> None:
+        # Chart series are derived from the processed frame; drop them on change
+        self._filtered_data = df
+        self._prepared_series_cache = None
+
     def extract(self, csv_file: str) -> pd.DataFrame:
         """Extract data from CSV file"""
         try:
@@ -67,32 +355,39 @@ class ETLProcessor:
 
             logger.info(f"Extracting data from {file_path}")
 
-            # Try different encodings
-            encodings = ["utf-8", "latin-1", "cp1252", "iso-8859-1"]
-            df = None
-
-            for encoding in encodings:
-                try:
-                    df = pd.read_csv(file_path, encoding=encoding)
-                    logger.info(f"Successfully loaded with {encoding} encoding")
-                    break
-                except UnicodeDecodeError:
-                    continue
-
-            if df is None:
-                raise ValueError(
-                    "Could not decode CSV file with any supported encoding"
+            # Small files are memoized per (path, mtime), so repeated runs
+            # over an unchanged file only redo filters and transformations;
+            # larger ones are parsed fresh so the cache stays bounded
+            file_path_abs = os.path.abspath(file_path)
+            if os.path.getsize(file_path_abs) <= CSV_CACHE_MAX_BYTES:
+                df, read_info = _read_csv_cached(
+                    file_path_abs, os.path.getmtime(file_path_abs)
                 )
+                # A shallow copy shares the cached data, and Copy-on-Write
+                # keeps the caller's edits out of it
+                df = df.copy(deep=False)
+            else:
+                df, read_info = _read_csv_file(file_path_abs)
+
+            n_rows, n_cols = df.shape
 
             # Store metadata
             self.etl_metadata["extraction"] = {
                 "file_path": file_path,
-                "rows": len(df),
-                "columns": len(df.columns),
+                "parser": read_info["parser"],
+                # Copied so metadata edits cannot reach the cached read info
+                "dtypes": {
+                    col: dict(change) for col, change in read_info["dtypes"].items()
+                },
+                "rows": n_rows,
+                "columns": n_cols,
+                "categorical_cols": df.select_dtypes(
+                    include=["category"]
+                ).columns.tolist(),
                 "timestamp": datetime.now().isoformat(),
             }
 
-            logger.info(f"Extracted {len(df)} rows and {len(df.columns)} columns")
+            logger.info(f"Extracted {n_rows} rows and {n_cols} columns")
             self.raw_data = df
             return df
 
@@ -110,7 +405,11 @@ class ETLProcessor:
             raise ValueError("No data to transform. Call extract() first.")
 
         logger.info("Starting data transformation")
-        df = self.raw_data.copy()
+        # Every step below returns a new frame, so raw_data is never mutated
+        df = self.raw_data
+        # Filters and transformations never change which columns are numeric,
+        # so the dtype scan is done once and shared by the steps below
+        numeric_cols = df.select_dtypes(include=[np.number]).columns
 
         # Apply filters
         if filters:
@@ -118,103 +417,171 @@ class ETLProcessor:
 
         # Apply transformations
         if transformations:
-            df = self._apply_transformations(df, transformations)
+            df = self._apply_transformations(df, transformations, numeric_cols)
 
         # Clean data
-        df = self._clean_data(df)
+        df = self._clean_data(df, numeric_cols)
+        n_rows = len(df)
 
         # Store metadata
         self.etl_metadata["transformation"] = {
             "filters_applied": filters,
             "transformations_applied": transformations,
             "rows_before": len(self.raw_data),
-            "rows_after": len(df),
+            "rows_after": n_rows,
             "timestamp": datetime.now().isoformat(),
         }
 
-        logger.info(f"Transformation complete. {len(df)} rows remaining")
+        logger.info(f"Transformation complete. {n_rows} rows remaining")
         self.filtered_data = df
         return df
 
     def _apply_filters(self, df: pd.DataFrame, filters: Dict) -> pd.DataFrame:
         """Apply filters to DataFrame"""
-        for column, condition in filters.items():
+        # Combine every condition into one mask and slice the frame once
+        mask = np.ones(len(df), dtype=bool)
+
+        for column, predicate in self._compile_filters(filters):
             if column not in df.columns:
                 logger.warning(f"Column {column} not found in data")
                 continue
+            if predicate is None:
+                continue
 
-            if isinstance(condition, dict):
-                if "min" in condition and "max" in condition:
-                    df = df[
-                        (df[column] >= condition["min"])
-                        & (df[column] <= condition["max"])
-                    ]
-                elif "min" in condition:
-                    df = df[df[column] >= condition["min"]]
-                elif "max" in condition:
-                    df = df[df[column] <= condition["max"]]
-            elif isinstance(condition, list):
-                df = df[df[column].isin(condition)]
-            else:
-                df = df[df[column] == condition]
+            np.logical_and(
+                mask,
+                predicate(df[column]).to_numpy(dtype=bool, na_value=False),
+                out=mask,
+            )
 
-        return df
+        return df.loc[mask]
+
+    def _compile_filters(
+        self, filters: Dict
+    ) -> List[Tuple[str, Optional[Callable[[pd.Series], pd.Series]]]]:
+        """Turn a filter spec into (column, predicate) pairs, reusing repeats"""
+        key = repr(filters)
+        compiled = self._compiled_filters.get(key)
+        if compiled is None:
+            if len(self._compiled_filters) >= COMPILED_FILTERS_MAX:
+                self._compiled_filters.clear()
+            compiled = [
+                (column, _compile_condition(condition))
+                for column, condition in filters.items()
+            ]
+            self._compiled_filters[key] = compiled
+        return compiled
 
     def _apply_transformations(
-        self, df: pd.DataFrame, transformations: List[str]
+        self,
+        df: pd.DataFrame,
+        transformations: List[str],
+        numeric_cols: Optional[pd.Index] = None,
     ) -> pd.DataFrame:
         """Apply transformations to DataFrame"""
-        for transformation in transformations:
-            if transformation == "normalize":
-                numeric_cols = df.select_dtypes(include=[np.number]).columns
-                for col in numeric_cols:
-                    if df[col].std() != 0:
-                        df[col] = (df[col] - df[col].min()) / (
-                            df[col].max() - df[col].min()
-                        )
-
-            elif transformation == "standardize":
-                numeric_cols = df.select_dtypes(include=[np.number]).columns
-                for col in numeric_cols:
-                    if df[col].std() != 0:
-                        df[col] = (df[col] - df[col].mean()) / df[col].std()
+        if numeric_cols is None:
+            numeric_cols = df.select_dtypes(include=[np.number]).columns
+        if len(numeric_cols) == 0 or len(df) == 0:
+            return df
 
-            elif transformation == "log_transform":
-                numeric_cols = df.select_dtypes(include=[np.number]).columns
-                for col in numeric_cols:
-                    if (df[col] > 0).all():
-                        df[col] = np.log1p(df[col])
+        # Run every transformation on one float block and write back only
+        # the columns that actually changed, so untouched ints keep dtype
+        arr = df[numeric_cols].to_numpy(dtype=np.float64, copy=True)
+        changed = np.zeros(len(numeric_cols), dtype=bool)
+
+        with warnings.catch_warnings():
+            # All-NaN and single-value columns are expected here
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+
+            for transformation in transformations:
+                if transformation == "normalize":
+                    col_min = np.nanmin(arr, axis=0)
+                    span = np.nanmax(arr, axis=0) - col_min
+                    cols = span != 0
+                    arr[:, cols] = (arr[:, cols] - col_min[cols]) / span[cols]
+                    changed |= cols
+
+                elif transformation == "standardize":
+                    std = np.nanstd(arr, axis=0, ddof=1)
+                    cols = std != 0
+                    mean = np.nanmean(arr, axis=0)
+                    arr[:, cols] = (arr[:, cols] - mean[cols]) / std[cols]
+                    changed |= cols
+
+                elif transformation == "log_transform":
+                    cols = (arr > 0).all(axis=0)
+                    arr[:, cols] = np.log1p(arr[:, cols])
+                    changed |= cols
+
+        if changed.any():
+            df = df.assign(
+                **{col: arr[:, i] for i, col in enumerate(numeric_cols) if changed[i]}
+            )
 
         return df
 
-    def _clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _clean_data(
+        self, df: pd.DataFrame, numeric_cols: Optional[pd.Index] = None
+    ) -> pd.DataFrame:
         """Clean data by removing duplicates and handling missing values"""
         initial_rows = len(df)
 
+        if numeric_cols is None:
+            numeric_cols = df.select_dtypes(include=[np.number]).columns
+        non_numeric_cols = df.columns.difference(numeric_cols, sort=False)
+
         # Remove duplicates
         df = df.drop_duplicates()
 
         # Handle missing values
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
         if len(numeric_cols) > 0:
-            df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].median())
-
-        non_numeric_cols = df.select_dtypes(exclude=[np.number]).columns
+            arr = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            missing = np.isnan(arr)
+            has_missing = missing.any(axis=0)
+
+            if has_missing.any():
+                # Fill only the columns with gaps, from one nanmedian call
+                block = arr[:, has_missing]
+                with warnings.catch_warnings():
+                    # All-NaN columns stay NaN, as with Series.median()
+                    warnings.simplefilter("ignore", category=RuntimeWarning)
+                    medians = np.nanmedian(block, axis=0)
+                rows, cols = np.nonzero(missing[:, has_missing])
+                block[rows, cols] = medians[cols]
+
+                filled = {}
+                for i, col in enumerate(numeric_cols[has_missing]):
+                    dtype = df[col].dtype
+                    # Nullable extension dtypes (Int64, Float64) keep their
+                    # type by filling the column itself with its median
+                    filled[col] = (
+                        block[:, i].astype(dtype, copy=False)
+                        if isinstance(dtype, np.dtype)
+                        else df[col].fillna(medians[i])
+                    )
+                df = df.assign(**filled)
+
+        # Categoricals only accept fill values that are already categories
+        for col in df[non_numeric_cols].select_dtypes(include=["category"]).columns:
+            if df[col].hasnans and "Unknown" not in df[col].cat.categories:
+                df[col] = df[col].cat.add_categories("Unknown")
         df[non_numeric_cols] = df[non_numeric_cols].fillna("Unknown")
 
-        # Try to convert object columns to numeric
-        for col in df.columns:
-            if df[col].dtype == "object":
-                try:
-                    pd.to_numeric(df[col], errors="raise")
-                    df[col] = pd.to_numeric(df[col])
-                except (ValueError, TypeError):
-                    pass
+        # Try to convert text columns to numeric; one raising call per column
+        # stops at the first non-numeric value and its result is reused
+        converted_cols = {}
+        for col in df.select_dtypes(include=["object", "string"]).columns:
+            try:
+                converted_cols[col] = pd.to_numeric(df[col])
+            except (ValueError, TypeError):
+                pass
+        if converted_cols:
+            df = df.assign(**converted_cols)
 
         logger.info(f"Data cleaning: {initial_rows - len(df)} duplicates removed")
         return df
 
-    def load(self, output_format: str = "excel") -> Dict[str, str]:
+    def load(self, output_format: str = "parquet") -> Dict[str, str]:
         """Load processed data to files"""
         if self.filtered_data is None:
             raise ValueError("No processed data to load. Call transform() first.")
@@ -222,7 +589,14 @@ class ETLProcessor:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_files = {}
 
-        if output_format == "excel":
+        if output_format == "parquet":
+            file_path = f"{self.output_dir}/processed_data_{timestamp}.parquet"
+            _parquet_safe(self.filtered_data).to_parquet(
+                file_path, engine="pyarrow", compression="zstd", index=False
+            )
+            output_files["parquet"] = file_path
+
+        elif output_format == "excel":
             file_path = f"{self.output_dir}/processed_data_{timestamp}.xlsx"
             self.filtered_data.to_excel(file_path, index=False)
             output_files["excel"] = file_path
@@ -237,23 +611,51 @@ class ETLProcessor:
             self.filtered_data.to_json(file_path, orient="records", indent=2)
             output_files["json"] = file_path
 
+        self.etl_metadata["load"] = {
+            "format": output_format,
+            "timestamp": datetime.now().isoformat(),
+        }
+
         # Save metadata
         metadata_path = f"{self.output_dir}/etl_metadata_{timestamp}.json"
-        with open(metadata_path, "w") as f:
-            json.dump(self.etl_metadata, f, indent=2)
+        with open(metadata_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    self.etl_metadata,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS,
+                    default=str,
+                )
+            )
 
         output_files["metadata"] = metadata_path
         logger.info(f"Data loaded to {len(output_files)} files")
 
         return output_files
 
+    def _prepare_series(self) -> Dict[str, Any]:
+        """Convert the chart-visible head of each numeric column once"""
+        if self._prepared_series_cache is None:
+            df = cast(pd.DataFrame, self.filtered_data)
+            numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+            head = df[numeric_cols].head(CHART_MAX_POINTS)
+            self._prepared_series_cache = {
+                "numeric_cols": numeric_cols,
+                "index": head.index.tolist(),
+                "columns": {col: head[col].to_numpy().tolist() for col in numeric_cols},
+            }
+        return self._prepared_series_cache
+
     def generate_apexcharts_config(self, chart_type: str = "line") -> Dict[str, Any]:
         """Generate ApexCharts configuration"""
         if self.filtered_data is None:
             raise ValueError("No processed data available")
 
-        df = self.filtered_data
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+        prepared = self._prepare_series()
+        numeric_cols = prepared["numeric_cols"]
+        columns = prepared["columns"]
+        index = prepared["index"]
 
         if len(numeric_cols) == 0:
             raise ValueError("No numeric columns available for charting")
@@ -269,27 +671,24 @@ class ETLProcessor:
             "colors": ["#00D4FF", "#0099CC", "#00FF88", "#FFB800", "#FF4444"],
         }
 
-        if chart_type == "line":
+        if chart_type in ("line", "area"):
+            kind = "Line" if chart_type == "line" else "Area"
             if len(numeric_cols) >= 2:
                 x_col = numeric_cols[0]
                 y_col = numeric_cols[1]
-                data = df[[x_col, y_col]].head(20).to_dict("records")
+                xs = columns[x_col]
+                ys = columns[y_col]
 
                 config = {
                     **base_config,
                     "title": {
-                        "text": f"{x_col} vs {y_col} - Line Chart",
+                        "text": f"{x_col} vs {y_col} - {kind} Chart",
                         "style": {"color": "#FFFFFF"},
                     },
-                    "series": [
-                        {
-                            "name": y_col,
-                            "data": [
-                                {"x": str(row[x_col]), "y": row[y_col]} for row in data
-                            ],
-                        }
-                    ],
+                    # Paired arrays rather than per-point {x, y} objects
+                    "series": [{"name": y_col, "data": ys}],
                     "xaxis": {
+                        "categories": [str(x) for x in xs],
                         "title": {"text": x_col},
                         "labels": {"style": {"colors": "#B0B0B0"}},
                     },
@@ -299,81 +698,42 @@ class ETLProcessor:
                     },
                 }
             else:
-                raise ValueError("Line chart requires at least 2 numeric columns")
+                raise ValueError(f"{kind} chart requires at least 2 numeric columns")
 
         elif chart_type == "bar":
-            if len(numeric_cols) >= 1:
-                col = numeric_cols[0]
-                data = df[col].head(10).to_dict()
-
-                config = {
-                    **base_config,
-                    "title": {
-                        "text": f"{col} - Bar Chart",
-                        "style": {"color": "#FFFFFF"},
-                    },
-                    "series": [{"name": col, "data": list(data.values())}],
-                    "xaxis": {
-                        "categories": list(data.keys()),
-                        "labels": {"style": {"colors": "#B0B0B0"}},
-                    },
-                }
-            else:
-                raise ValueError("Bar chart requires at least 1 numeric column")
+            col = numeric_cols[0]
+
+            config = {
+                **base_config,
+                "title": {
+                    "text": f"{col} - Bar Chart",
+                    "style": {"color": "#FFFFFF"},
+                },
+                "series": [{"name": col, "data": columns[col][:BAR_CHART_MAX_POINTS]}],
+                "xaxis": {
+                    "categories": index[:BAR_CHART_MAX_POINTS],
+                    "labels": {"style": {"colors": "#B0B0B0"}},
+                },
+            }
 
         elif chart_type == "pie":
-            if len(numeric_cols) >= 1:
-                col = numeric_cols[0]
-                data = df[col].head(8).to_dict()
-
-                config = {
-                    **base_config,
-                    "title": {
-                        "text": f"{col} - Pie Chart",
-                        "style": {"color": "#FFFFFF"},
-                    },
-                    "series": list(data.values()),
-                    "labels": list(data.keys()),
-                }
-            else:
-                raise ValueError("Pie chart requires at least 1 numeric column")
-
-        elif chart_type == "area":
-            if len(numeric_cols) >= 2:
-                x_col = numeric_cols[0]
-                y_col = numeric_cols[1]
-                data = df[[x_col, y_col]].head(20).to_dict("records")
-
-                config = {
-                    **base_config,
-                    "title": {
-                        "text": f"{x_col} vs {y_col} - Area Chart",
-                        "style": {"color": "#FFFFFF"},
-                    },
-                    "series": [
-                        {
-                            "name": y_col,
-                            "data": [
-                                {"x": str(row[x_col]), "y": row[y_col]} for row in data
-                            ],
-                        }
-                    ],
-                    "xaxis": {
-                        "title": {"text": x_col},
-                        "labels": {"style": {"colors": "#B0B0B0"}},
-                    },
-                    "yaxis": {
-                        "title": {"text": y_col},
-                        "labels": {"style": {"colors": "#B0B0B0"}},
-                    },
-                }
-            else:
-                raise ValueError("Area chart requires at least 2 numeric columns")
+            col = numeric_cols[0]
+
+            config = {
+                **base_config,
+                "title": {
+                    "text": f"{col} - Pie Chart",
+                    "style": {"color": "#FFFFFF"},
+                },
+                "series": columns[col][:PIE_CHART_MAX_SLICES],
+                "labels": index[:PIE_CHART_MAX_SLICES],
+            }
 
         elif chart_type == "scatter":
             if len(numeric_cols) >= 2:
                 col1, col2 = numeric_cols[0], numeric_cols[1]
-                data = df[[col1, col2]].head(20).to_dict("records")
+                # Zip the cached lists; stacking would upcast ints beside floats
+                points = [list(p) for p in zip(columns[col1], columns[col2])]
 
                 config = {
                     **base_config,
@@ -384,7 +744,7 @@ class ETLProcessor:
                     "series": [
                         {
                             "name": f"{col1} vs {col2}",
-                            "data": [{"x": row[col1], "y": row[col2]} for row in data],
+                            "data": points,
                         }
                     ],
                     "xaxis": {
@@ -404,6 +764,40 @@ class ETLProcessor:
 
         return config
 
+    def generate_chart_configs(
+        self, chart_types: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Generate ApexCharts configurations for several chart types.
+
+        Chart types that cannot be built from the current data are logged and
+        left out of the result.
+        """
+        if chart_types is None:
+            chart_types = DASHBOARD_CHART_TYPES
+
+        # Convert the series once up front; every chart type reuses them
+        if self.filtered_data is not None:
+            self._prepare_series()
+
+        chart_configs = {}
+        for chart_type in chart_types:
+            try:
+                chart_configs[chart_type] = self.generate_apexcharts_config(chart_type)
+            except Exception as e:
+                logger.warning(f"Could not generate {chart_type} chart: {str(e)}")
+
+        return chart_configs
+
+    def get_summary(self) -> Dict[str, int]:
+        """Row and column counts for the raw and processed data"""
+        raw, processed = self.raw_data, self.filtered_data
+        n_rows, n_cols = processed.shape if processed is not None else (0, 0)
+        return {
+            "original_rows": len(raw) if raw is not None else 0,
+            "processed_rows": n_rows,
+            "columns": n_cols,
+        }
+
     def create_flow_chart_data(self) -> Dict[str, Any]:
         """Create flow chart data for ETL process"""
         return {
@@ -441,29 +835,14 @@ class ETLProcessor:
         output_files = self.load()
 
         # Generate chart configurations
-        chart_configs = {}
-        for chart_type in ["line", "bar", "area", "pie"]:
-            try:
-                chart_configs[chart_type] = self.generate_apexcharts_config(chart_type)
-            except Exception as e:
-                logger.warning(f"Could not generate {chart_type} chart: {str(e)}")
+        chart_configs = self.generate_chart_configs()
 
         # Create flow chart data
         flow_data = self.create_flow_chart_data()
 
         # Prepare results
         results = {
-            "summary": {
-                "original_rows": len(self.raw_data) if self.raw_data is not None else 0,
-                "processed_rows": (
-                    len(self.filtered_data) if self.filtered_data is not None else 0
-                ),
-                "columns": (
-                    len(self.filtered_data.columns)
-                    if self.filtered_data is not None
-                    else 0
-                ),
-            },
+            "summary": self.get_summary(),
             "chart_configs": chart_configs,
             "flow_data": flow_data,
             "output_files": output_files,
@@ -520,14 +899,7 @@ async def get_etl_data():
                 )
 
         # Generate chart configurations
-        chart_configs = {}
-        for chart_type in ["line", "bar", "area", "pie"]:
-            try:
-                chart_configs[chart_type] = etl_processor.generate_apexcharts_config(
-                    chart_type
-                )
-            except Exception as e:
-                logger.warning(f"Could not generate {chart_type} chart: {str(e)}")
+        chart_configs = etl_processor.generate_chart_configs()
 
         # Create flow chart data
         flow_data = etl_processor.create_flow_chart_data()
@@ -544,23 +916,7 @@ async def get_etl_data():
             "charts": chart_configs,  # alias for compatibility
             "processed_data": processed_preview,
             "flow_data": flow_data,
-            "summary": {
-                "original_rows": (
-                    len(etl_processor.raw_data)
-                    if etl_processor.raw_data is not None
-                    else 0
-                ),
-                "processed_rows": (
-                    len(etl_processor.filtered_data)
-                    if etl_processor.filtered_data is not None
-                    else 0
-                ),
-                "columns": (
-                    len(etl_processor.filtered_data.columns)
-                    if etl_processor.filtered_data is not None
-                    else 0
-                ),
-            },
+            "summary": etl_processor.get_summary(),
             "metadata": etl_processor.etl_metadata,
         }
 
@@ -620,46 +976,30 @@ async def apply_filters(percentage: float = Query(0.5)):
             else:
                 raise HTTPException(status_code=400, detail="No data available to filter")
 
-        df = etl_processor.raw_data.copy()
+        df = etl_processor.raw_data
+        n_rows = len(df)
         # Reduce rows by percentage deterministically
-        rows = max(1, int(len(df) * max(0.0, min(1.0, percentage))))
+        rows = max(1, int(n_rows * max(0.0, min(1.0, percentage))))
         filtered = df.head(rows)
         filtered = etl_processor._clean_data(filtered)
         etl_processor.filtered_data = filtered
         etl_processor.etl_metadata["filtering"] = {
             "strategy": "row_head_percentage",
             "percentage": percentage,
-            "rows_before": len(df),
+            "rows_before": n_rows,
             "rows_after": len(filtered),
             "timestamp": datetime.now().isoformat(),
         }
 
         # Build response similar to /api/etl-data
-        chart_configs: Dict[str, Any] = {}
-        for chart_type in ["line", "bar", "area", "pie"]:
-            try:
-                chart_configs[chart_type] = etl_processor.generate_apexcharts_config(
-                    chart_type
-                )
-            except Exception as exc:
-                logger.warning(f"Could not generate {chart_type} chart: {str(exc)}")
+        chart_configs = etl_processor.generate_chart_configs()
 
         response = {
             "chart_configs": chart_configs,
             "charts": chart_configs,
             "processed_data": filtered.head(50).to_dict(orient="records"),
             "flow_data": etl_processor.create_flow_chart_data(),
-            "summary": {
-                "original_rows": len(etl_processor.raw_data)
-                if etl_processor.raw_data is not None
-                else 0,
-                "processed_rows": len(etl_processor.filtered_data)
-                if etl_processor.filtered_data is not None
-                else 0,
-                "columns": len(etl_processor.filtered_data.columns)
-                if etl_processor.filtered_data is not None
-                else 0,
-            },
+            "summary": etl_processor.get_summary(),
             "metadata": etl_processor.etl_metadata,
         }
         return response
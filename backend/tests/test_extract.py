@@ -0,0 +1,158 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from backend import main
+from backend.main import ETLProcessor
+
+
+def test_extract_reuses_parse_until_file_changes(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("a,b\n1,2\n3,4\n")
+    processor = ETLProcessor(data_dir=str(tmp_path), output_dir=str(tmp_path / "out"))
+
+    first = processor.extract(str(csv_path))
+    second = processor.extract(str(csv_path))
+    assert np.shares_memory(first["a"].to_numpy(), second["a"].to_numpy())
+
+    # Rewriting the file bumps its mtime and must trigger a fresh parse
+    csv_path.write_text("a,b\n5,6\n")
+    stat = os.stat(csv_path)
+    os.utime(csv_path, (stat.st_atime, stat.st_mtime + 10))
+    third = processor.extract(str(csv_path))
+    assert not np.shares_memory(first["a"].to_numpy(), third["a"].to_numpy())
+    assert third["a"].tolist() == [5]
+
+
+def test_extract_result_edits_do_not_reach_the_cache(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("a,b\n1,2\n3,4\n")
+
+    df = ETLProcessor(output_dir=str(tmp_path / "out")).extract(str(csv_path))
+    df["a"] = [100, 200]
+    df.loc[0, "b"] = 0
+
+    fresh = ETLProcessor(output_dir=str(tmp_path / "out")).extract(str(csv_path))
+    assert fresh["a"].tolist() == [1, 3]
+    assert fresh["b"].tolist() == [2, 4]
+
+
+def test_extract_parses_large_files_without_caching(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "CSV_CACHE_MAX_BYTES", 4)
+    csv_path = tmp_path / "large.csv"
+    csv_path.write_text("a,b\n1,2\n3,4\n")
+    processor = ETLProcessor(data_dir=str(tmp_path), output_dir=str(tmp_path / "out"))
+
+    first = processor.extract(str(csv_path))
+    second = processor.extract(str(csv_path))
+    assert not np.shares_memory(first["a"].to_numpy(), second["a"].to_numpy())
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_extract_marks_repetitive_text_columns_categorical(tmp_path):
+    csv_path = tmp_path / "regions.csv"
+    csv_path.write_text(
+        "day,region,sales\n"
+        "2024-01-01,North,1\n"
+        "2024-01-02,North,2\n"
+        "2024-01-03,South,3\n"
+        "2024-01-04,South,4\n"
+        "2024-01-05,North,5\n"
+        "2024-01-06,South,6\n"
+        "2024-01-07,North,7\n"
+        "2024-01-08,,8\n"
+    )
+    processor = ETLProcessor(data_dir=str(tmp_path), output_dir=str(tmp_path / "out"))
+    df = processor.extract(str(csv_path))
+
+    assert processor.etl_metadata["extraction"]["categorical_cols"] == ["region"]
+    assert str(df["region"].dtype) == "category"
+    assert str(df["day"].dtype) != "category"
+
+    # Range filters on text and NaN filling keep working on categoricals
+    processed = processor.transform(filters={"region": {"min": "N"}})
+    assert processed["region"].tolist() == [
+        "North",
+        "North",
+        "South",
+        "South",
+        "North",
+        "South",
+        "North",
+    ]
+    processed = processor.transform()
+    assert processed["region"].tolist()[-1] == "Unknown"
+
+
+def test_extract_latin1_file(tmp_path):
+    csv_path = tmp_path / "latin1.csv"
+    csv_path.write_bytes("name,score\nJosé,1\nRené,2\n".encode("latin-1"))
+    processor = ETLProcessor(data_dir=str(tmp_path), output_dir=str(tmp_path / "out"))
+    df = processor.extract(str(csv_path))
+    assert df["name"].tolist() == ["José", "René"]
+
+
+def test_extract_with_pyarrow_keeps_dates_as_text(tmp_path):
+    csv_path = tmp_path / "dated.csv"
+    csv_path.write_text(
+        "day,stamp,value\n2024-01-01,2024-01-01T10:00,1\n,2024-01-02 11:00:00,\n"
+    )
+    processor = ETLProcessor(data_dir=str(tmp_path), output_dir=str(tmp_path / "out"))
+    df = processor.extract(str(csv_path))
+
+    assert processor.etl_metadata["extraction"]["parser"] == "pyarrow"
+    assert df["day"].tolist()[0] == "2024-01-01"
+    assert df["stamp"].tolist() == ["2024-01-01T10:00", "2024-01-02 11:00:00"]
+    assert df["day"].isna().tolist() == [False, True]
+    assert df["value"].isna().tolist() == [False, True]
+
+
+def test_extract_with_pyarrow_matches_c_parser_headers_and_empty_columns(tmp_path):
+    csv_path = tmp_path / "indexed.csv"
+    csv_path.write_text(",a,blank,nones\n0,1,,None\n1,2,,nan\n")
+    processor = ETLProcessor(data_dir=str(tmp_path), output_dir=str(tmp_path / "out"))
+    df = processor.extract(str(csv_path))
+
+    assert processor.etl_metadata["extraction"]["parser"] == "pyarrow"
+    assert df.columns.tolist() == ["Unnamed: 0", "a", "blank", "nones"]
+    assert str(df["blank"].dtype) == "float64"
+    assert str(df["nones"].dtype) == "float64"
+    assert df["nones"].isna().all()
+
+
+def test_extract_falls_back_to_c_parser(tmp_path):
+    processor = ETLProcessor(data_dir=str(tmp_path), output_dir=str(tmp_path / "out"))
+
+    duplicated = tmp_path / "duplicated.csv"
+    duplicated.write_text("a,a\n1,2\n")
+    df = processor.extract(str(duplicated))
+    assert processor.etl_metadata["extraction"]["parser"] == "c"
+    assert df.columns.tolist() == ["a", "a.1"]
+
+    ragged = tmp_path / "ragged.csv"
+    ragged.write_text("a,b\n1,2\n3\n")
+    df = processor.extract(str(ragged))
+    assert processor.etl_metadata["extraction"]["parser"] == "c"
+    assert df["b"].isna().tolist() == [False, True]
+
+    overflow = tmp_path / "overflow.csv"
+    overflow.write_text("a\n18446744073709551615\n1\n")
+    df = processor.extract(str(overflow))
+    assert processor.etl_metadata["extraction"]["parser"] == "c"
+    assert df["a"].tolist()[0] == 18446744073709551615
+
+
+def test_extract_downcasts_integer_columns(tmp_path):
+    csv_path = tmp_path / "counts.csv"
+    csv_path.write_text("small,large,ratio\n1,100000,0.1\n2,200000,0.2\n")
+    processor = ETLProcessor(data_dir=str(tmp_path), output_dir=str(tmp_path / "out"))
+    df = processor.extract(str(csv_path))
+
+    assert str(df["small"].dtype) == "int8"
+    assert str(df["large"].dtype) == "int32"
+    assert str(df["ratio"].dtype) == "float64"
+    assert processor.etl_metadata["extraction"]["dtypes"]["small"] == {
+        "original": "int64",
+        "downcast": "int8",
+    }
@@ -1,5 +1,11 @@
+import numpy as np
 import pandas as pd
-from backend.main import ETLProcessor
+from backend.main import (
+  BAR_CHART_MAX_POINTS,
+  CHART_MAX_POINTS,
+  PIE_CHART_MAX_SLICES,
+  ETLProcessor,
+)
 
 
 def test_transform_filters_and_transformations_cover_branches(tmp_path):
@@ -31,3 +37,186 @@ def test_transform_filters_and_transformations_cover_branches(tmp_path):
   # Cover loading to files
   outputs = processor.load('csv')
   assert 'csv' in outputs
+
+
+def test_transformations_on_filtered_out_frame_return_empty(tmp_path):
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  processor.raw_data = pd.DataFrame({'a': [1.0, 2.0], 'b': [3, 4]})
+  df = processor.transform(
+      filters={'a': {'min': 100}},
+      transformations=['normalize', 'standardize', 'log_transform'],
+  )
+  assert df.empty
+  assert df.columns.tolist() == ['a', 'b']
+
+
+def test_chart_series_cache_resets_with_filtered_data(tmp_path):
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  processor.filtered_data = pd.DataFrame({'x': [1, 2], 'y': [3, 4]})
+  first = processor.generate_apexcharts_config('bar')
+  assert first['series'][0]['data'] == [1, 2]
+
+  processor.filtered_data = pd.DataFrame({'x': [7, 8, 9], 'y': [1, 1, 1]})
+  second = processor.generate_apexcharts_config('bar')
+  assert second['series'][0]['data'] == [7, 8, 9]
+  assert second['xaxis']['categories'] == [0, 1, 2]
+
+
+def test_line_chart_emits_paired_arrays(tmp_path):
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  processor.filtered_data = pd.DataFrame({'x': [1, 2, 3], 'y': [10.5, 20.0, 30.25]})
+  cfg = processor.generate_apexcharts_config('line')
+  assert cfg['series'] == [{'name': 'y', 'data': [10.5, 20.0, 30.25]}]
+  assert cfg['xaxis']['categories'] == ['1', '2', '3']
+
+
+def test_chart_lengths_follow_point_limits(tmp_path):
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  processor.filtered_data = pd.DataFrame({'x': range(30), 'y': range(30)})
+  lengths = {
+      chart_type: len(processor.generate_apexcharts_config(chart_type)['series'][0]['data'])
+      for chart_type in ('line', 'area', 'bar', 'scatter')
+  }
+  assert lengths == {
+      'line': CHART_MAX_POINTS,
+      'area': CHART_MAX_POINTS,
+      'bar': BAR_CHART_MAX_POINTS,
+      'scatter': CHART_MAX_POINTS,
+  }
+  assert len(processor.generate_apexcharts_config('pie')['series']) == PIE_CHART_MAX_SLICES
+
+
+def test_scatter_chart_emits_point_pairs(tmp_path):
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  processor.filtered_data = pd.DataFrame({'x': [1, 2], 'y': [3, 4]})
+  cfg = processor.generate_apexcharts_config('scatter')
+  assert cfg['series'][0]['data'] == [[1, 3], [2, 4]]
+
+
+def test_scatter_chart_keeps_integer_x_beside_float_y(tmp_path):
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  processor.filtered_data = pd.DataFrame({
+      'x': np.array([1, 2], dtype='int8'),
+      'y': [0.5, 1.5],
+      'big': [2**53 + 1, 2**53 + 3],
+  })
+  data = processor.generate_apexcharts_config('scatter')['series'][0]['data']
+  assert data == [[1, 0.5], [2, 1.5]]
+  assert all(isinstance(x, int) for x, _ in data)
+
+  processor.filtered_data = processor.filtered_data[['big', 'y']]
+  data = processor.generate_apexcharts_config('scatter')['series'][0]['data']
+  assert [x for x, _ in data] == [2**53 + 1, 2**53 + 3]
+
+
+def test_clean_data_converts_only_fully_numeric_text(tmp_path):
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  df = pd.DataFrame({
+      'digits': pd.Series(['1', '2', '3'], dtype=object),
+      'mixed': pd.Series(['1', 'two', '3'], dtype=object),
+  })
+  cleaned = processor._clean_data(df)
+  assert cleaned['digits'].tolist() == [1, 2, 3]
+  assert cleaned['mixed'].tolist() == ['1', 'two', '3']
+
+
+def test_transform_leaves_raw_data_untouched(tmp_path):
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  processor.raw_data = pd.DataFrame({'num': [1.0, None, 3.0, 3.0], 'cat': ['x', None, 'y', 'y']})
+  original = processor.raw_data.copy()
+
+  processor.transform(transformations=['normalize', 'standardize', 'log_transform'])
+  processor.transform()
+
+  pd.testing.assert_frame_equal(processor.raw_data, original)
+
+
+def test_load_json_writes_records(tmp_path):
+  import json
+
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  processor.filtered_data = pd.DataFrame({'num': [1, 2], 'val': [0.5, float('nan')]})
+  outputs = processor.load('json')
+  with open(outputs['json']) as f:
+    assert json.load(f) == [{'num': 1, 'val': 0.5}, {'num': 2, 'val': None}]
+
+
+def test_load_json_accepts_non_string_labels(tmp_path):
+  import json
+
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  processor.filtered_data = pd.DataFrame({1: [1, 2], 'val': [0.5, 1.5]})
+  processor.etl_metadata['transformation'] = {'filters_applied': {1: {'min': 0}}}
+  outputs = processor.load('json')
+  with open(outputs['json']) as f:
+    assert json.load(f) == [{'1': 1, 'val': 0.5}, {'1': 2, 'val': 1.5}]
+  with open(outputs['metadata']) as f:
+    assert json.load(f)['transformation']['filters_applied'] == {'1': {'min': 0}}
+
+
+def test_load_defaults_to_parquet(tmp_path):
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  processor.filtered_data = pd.DataFrame({'num': [1, 2], 'cat': ['a', 'b']})
+  outputs = processor.load()
+  assert outputs['parquet'].endswith('.parquet')
+  pd.testing.assert_frame_equal(pd.read_parquet(outputs['parquet']), processor.filtered_data)
+  assert processor.etl_metadata['load']['format'] == 'parquet'
+
+
+def test_load_parquet_writes_mixed_object_columns_as_text(tmp_path):
+  csv_path = tmp_path / 'flags.csv'
+  csv_path.write_text('flag,v\ntrue,1\n,2\nfalse,3\n')
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  processor.extract(str(csv_path))
+  processor.transform()
+  outputs = processor.load()
+  written = pd.read_parquet(outputs['parquet'])
+  assert written['flag'].tolist() == ['True', 'Unknown', 'False']
+  assert written['v'].tolist() == [1, 2, 3]
+
+
+def test_clean_data_drops_duplicates_like_pandas(tmp_path):
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  nans = np.array([np.nan, np.nan, np.nan])
+  # NaNs that differ in sign bit or payload are still one value to pandas
+  nans.view(np.uint64)[1] |= np.uint64(1 << 63)
+  nans.view(np.uint64)[2] |= np.uint64(1)
+  df = pd.DataFrame({'a': nans, 'b': [1.0, 1.0, 1.0]})
+  assert len(processor._clean_data(df)) == 1
+
+  assert processor._clean_data(pd.DataFrame(index=range(3))).shape == (3, 0)
+
+
+def test_clean_data_fills_numeric_gaps_with_column_median(tmp_path):
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  df = pd.DataFrame({'a': [1.0, None, 3.0, 10.0], 'b': [1, 2, 3, 4], 'c': [None] * 4})
+  cleaned = processor._clean_data(df.astype({'c': float}))
+  assert cleaned['a'].tolist() == [1.0, 3.0, 3.0, 10.0]
+  assert str(cleaned['b'].dtype) == 'int64'
+  assert cleaned['c'].isna().all()
+
+
+def test_clean_data_keeps_nullable_integer_dtype(tmp_path):
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  df = pd.DataFrame({
+      'n': pd.array([1, None, 3], dtype='Int64'),
+      'f': pd.array([0.5, None, 1.5], dtype='Float64'),
+  })
+  cleaned = processor._clean_data(df)
+  assert str(cleaned['n'].dtype) == 'Int64'
+  assert cleaned['n'].tolist() == [1, 2, 3]
+  assert str(cleaned['f'].dtype) == 'Float64'
+  assert cleaned['f'].tolist() == [0.5, 1.0, 1.5]
+
+
+def test_repeated_filter_specs_reuse_compiled_predicates(tmp_path):
+  processor = ETLProcessor(data_dir='data', output_dir=str(tmp_path))
+  processor.raw_data = pd.DataFrame({'num': [1, 2, 3, 4], 'cat': ['A', 'B', 'A', 'C']})
+  filters = {'num': {'min': 2}, 'cat': ['A', 'C']}
+
+  first = processor.transform(filters=filters)
+  compiled = processor._compile_filters(filters)
+  second = processor.transform(filters={'num': {'min': 2}, 'cat': ['A', 'C']})
+
+  assert processor._compile_filters(filters) is compiled
+  assert first['num'].tolist() == second['num'].tolist() == [3, 4]